@@ -8,6 +8,10 @@ from pymodaq_plugins_keithley.hardware.keithley27XX.keithley27XX_VISADriver impo
 from pymodaq.utils.logger import set_logger, get_module_name
 logger = set_logger(get_module_name(__file__))
 
+# Dictionary linking channel's modes to physical quantities
+_MODE_LABELS = {'VOLT:DC': 'Voltage', 'VOLT:AC': 'Voltage', 'CURR:DC': 'Current', 'CURR:AC': 'Current',
+                'RES': 'Resistance', 'FRES': 'Resistance', 'FREQ': 'Frequency', 'TEMP': 'Temperature'}
+
 
 class DAQ_0DViewer_Keithley27XX(DAQ_Viewer_base):
     """ Keithley plugin class for a OD viewer.
@@ -25,13 +29,10 @@ class DAQ_0DViewer_Keithley27XX(DAQ_Viewer_base):
     instr: str
     panel: str
     channels_in_selected_mode: str
-    resources_list = []
-    
-    # Read configuration file
-    for instr in config["Keithley", "27XX"].keys():
-        if "INSTRUMENT" in instr:
-            resources_list += [config["Keithley", "27XX", instr, "rsrc_name"]]
-    logger.info("resources list = {}" .format(resources_list))
+
+    # Reuse the instruments listed by the driver from the configuration file
+    instruments_dict = {rsrc: instr for instr, rsrc in Keithley.list_instruments.items()}
+    resources_list = list(instruments_dict)
 
     params = comon_parameters + [
         {'title': 'Resources', 'name': 'resources', 'type': 'list', 'limits': resources_list,
@@ -42,12 +43,12 @@ class DAQ_0DViewer_Keithley27XX(DAQ_Viewer_base):
             {'title': 'ID', 'name': 'ID', 'type': 'text', 'value': ''},
             {'title': 'FRONT panel', 'name': 'frontpanel', 'visible': False, 'type': 'group', 'children': [
                 {'title': 'Mode', 'name': 'frontmode', 'type': 'list',
-                 'limits': ['VOLT:DC', 'VOLT:AC', 'CURR:DC', 'CURR:AC', 'RES', 'FRES', 'FREQ', 'TEMP'],
+                 'limits': list(_MODE_LABELS),
                  'value': 'VOLT:DC'},
             ]},
             {'title': 'REAR panel', 'name': 'rearpanel', 'visible': False, 'type': 'group', 'children': [
                 {'title': 'Mode', 'name': 'rearmode', 'type': 'list',
-                 'limits': ['SCAN_LIST', 'VOLT:DC', 'VOLT:AC', 'CURR:DC', 'CURR:AC', 'RES', 'FRES', 'FREQ', 'TEMP'],
+                 'limits': ['SCAN_LIST'] + list(_MODE_LABELS),
                  'value': 'SCAN_LIST'}
             ]},
         ]},
@@ -60,6 +61,10 @@ class DAQ_0DViewer_Keithley27XX(DAQ_Viewer_base):
         """Attributes init when DAQ_0DViewer_Keithley class is instanced"""
         self.controller: Keithley = None
         self.channels_in_selected_mode = None
+        self.mode_label = None
+        self.channels_labels = None
+        self.labels_by_mode = {}
+        self.indexes_by_mode = {}
         self.rsrc_name = None
         self.panel = None
         self.instr = None
@@ -80,16 +85,20 @@ class DAQ_0DViewer_Keithley27XX(DAQ_Viewer_base):
             # Read the configuration file to determine which mode to use and send corresponding instruction to driver
             if self.panel == 'FRONT':
                 value = param.value()
+                self.controller.current_mode = value
                 self.controller.set_mode(value)
             elif self.panel == 'REAR':
                 value = 'SCAN_' + param.value()
                 self.channels_in_selected_mode = self.controller.set_mode(value)
+                self.channels_labels = ['Channel ' + chan for chan in
+                                        self.channels_in_selected_mode[1:-1].replace('@', '').split(',')]
+            self.mode_label = _MODE_LABELS.get(self.controller.current_mode)
             current_error = self.controller.get_error()
             if current_error != '0,"No error"':
                 logger.error("The following error has been raised by the Keithley:\
-                        {} => Please refer to the User Manual to correct it\n\
+                        %s => Please refer to the User Manual to correct it\n\
                         Note: To make sure channels are well configured in the .toml file,\
-                        refer to section 15 'SCPI Reference Tables', Table 15-5" .format(current_error))
+                        refer to section 15 'SCPI Reference Tables', Table 15-5", current_error)
         if 'CURR' in param.value():
             """Verify if the switching modules support current measurement"""
             if self.controller.non_amp_module["MODULE01"] and self.controller.non_amp_module["MODULE02"]:
@@ -118,41 +127,52 @@ class DAQ_0DViewer_Keithley27XX(DAQ_Viewer_base):
         else:
             try:
                 # Select the resource to connect with and load the dedicated configuration
-                for instr in config["Keithley", "27XX"]:
-                    if "INSTRUMENT" in instr:
-                        if config["Keithley", "27XX", instr, "rsrc_name"] == self.settings["resources"]:
-                            self.rsrc_name = config["Keithley", "27XX", instr, "rsrc_name"]
-                            self.panel = config["Keithley", "27XX", instr, "panel"].upper()
-                            self.instr = instr
-                            logger.info("Panel configuration 0D_viewer: {}" .format(self.panel))
+                logger.info("resources list = %s", self.resources_list)
+                rsrc_name = self.settings["resources"]
+                if rsrc_name in self.instruments_dict:
+                    self.instr = self.instruments_dict[rsrc_name]
+                    self.rsrc_name = rsrc_name
+                    self.panel = config["Keithley", "27XX", self.instr, "panel"].upper()
+                    logger.info("Panel configuration 0D_viewer: %s", self.panel)
                 assert self.rsrc_name is not None, "rsrc_name"
                 assert self.panel is not None, "panel"
                 self.controller = Keithley(self.rsrc_name)
             except AssertionError as err:
-                logger.error("{}: {} did not match any configuration".format(type(err), str(err)))
+                logger.error("%s: %s did not match any configuration", type(err), err)
             except Exception as e:
                 raise Exception('No controller could be defined because an error occurred \
                 while connecting to the instrument. Error: {}'.format(str(e)))
 
         # Keithley initialization & identification
         self.controller.init_hardware()
-        txt = self.controller.get_idn()
-        self.settings.child('Keithley_Params', 'ID').setValue(txt)
+        keithley_params = self.settings.child('Keithley_Params')
+        keithley_params.child('ID').setValue(self.controller.idn)
 
         # Initialize detector communication and set the default value (SCAN_LIST)
         if self.panel == 'FRONT':
-            self.settings.child('Keithley_Params', 'rearpanel').visible = False
-            value = self.settings.child('Keithley_Params', 'frontpanel', 'frontmode').value()
+            keithley_params.child('rearpanel').visible = False
+            value = keithley_params.child('frontpanel', 'frontmode').value()
             self.controller.current_mode = value
             self.controller.set_mode(value)
         elif self.panel == 'REAR':
-            self.settings.child('Keithley_Params', 'frontpanel').visible = False
-            self.settings.child('Keithley_Params', 'frontpanel').value = 'REAR'
+            frontpanel = keithley_params.child('frontpanel')
+            frontpanel.visible = False
+            frontpanel.value = 'REAR'
             self.controller.configuration_sequence()
-            value = 'SCAN_' + self.settings.child('Keithley_Params', 'rearpanel', 'rearmode').value()
+            # Plot labels of the channels configured in each mode of the scan list
+            self.labels_by_mode = {key: ['Channel ' + str(chan) for chan in chans]
+                                   for key, chans in self.controller.modes_channels_dict.items() if chans}
+            # Position of these channels in the measurements returned when reading the scan list
+            scan_positions = {chan: i for i, chan in enumerate(self.controller.channels_scan_list.split(','))}
+            self.indexes_by_mode = {key: np.array([scan_positions[str(chan)] for chan in chans], dtype=int)
+                                    for key, chans in self.controller.modes_channels_dict.items() if chans}
+            value = 'SCAN_' + keithley_params.child('rearpanel', 'rearmode').value()
             self.channels_in_selected_mode = self.controller.set_mode(value)
-            logger.info("Channels to plot : {}" .format(self.channels_in_selected_mode))
-        logger.info("DAQ_viewer command sent to keithley visa driver : {}" .format(value))
+            self.channels_labels = ['Channel ' + chan for chan in
+                                    self.channels_in_selected_mode[1:-1].replace('@', '').split(',')]
+            logger.info("Channels to plot : %s", self.channels_in_selected_mode)
+        self.mode_label = _MODE_LABELS.get(self.controller.current_mode)
+        logger.info("DAQ_viewer command sent to keithley visa driver : %s", value)
 
         self.status.initialized = True
         self.status.controller = self.controller
@@ -175,47 +195,32 @@ class DAQ_0DViewer_Keithley27XX(DAQ_Viewer_base):
         :type kwargs: dict
         """
         # ACQUISITION OF DATA
-        if self.panel == 'FRONT':
-            data_tot = self.controller.data()
-            data_measurement = data_tot[1]
-        elif self.panel == 'REAR':
-            channels_in_selected_mode = self.channels_in_selected_mode[1:-1].replace('@', '')
-            chan_to_plot = []
-            data_tot = self.controller.data()
-            data_measurement = data_tot[1]
-            for i in range(len(channels_in_selected_mode.split(','))):
-                chan_to_plot.append('Channel ' + str(channels_in_selected_mode.split(',')[i]))
-            # Affect each value to the corresponding channel
-            dict_chan_value = dict(zip(channels_in_selected_mode.split(','), data_measurement))
-        # Dictionary linking channel's modes to physical quantities
-        dict_label_mode = {'VOLT:DC': 'Voltage', 'VOLT:AC': 'Voltage', 'CURR:DC': 'Current', 'CURR:AC': 'Current',
-                           'RES': 'Resistance', 'FRES': 'Resistance', 'FREQ': 'Frequency', 'TEMP': 'Temperature'}
+        data_tot = self.controller.data()
+        data_measurement = np.asarray(data_tot[1], dtype=float)
         # EMISSION OF DATA
         # When reading the scan_list, data are displayed and exported grouped by mode
         if not self.controller.reading_scan_list:
-            label = dict_label_mode[self.controller.current_mode]
             if self.panel == 'FRONT':
                 labels = 'Front input'
             elif self.panel == 'REAR':
-                labels = [chan_to_plot[i] for i in range(len(chan_to_plot))]
+                labels = self.channels_labels
             dte = DataToExport(name='keithley',
-                               data=[DataFromPlugins(name=label,
-                                                     data=[np.array([data_measurement[i]]) for i in
-                                                           range(len(data_measurement))],
+                               data=[DataFromPlugins(name=self.mode_label,
+                                                     data=[data_measurement[i:i + 1] for i in
+                                                           range(data_measurement.size)],
                                                      dim='Data0D',
                                                      labels=labels)])
 
         # Reading only channels configured in the selected mode
-        elif self.controller.reading_scan_list:
-            dte = DataToExport(name='keithley',
-                               data=[DataFromPlugins(name=dict_label_mode[key],
-                                                     data=[np.array([dict_chan_value[str(chan)]]) for chan in
-                                                           self.controller.modes_channels_dict.get(key)],
-                                                     dim='Data0D',
-                                                     labels=['Channel ' + str(chan) for chan in
-                                                             self.controller.modes_channels_dict.get(key)]
-                                                     ) for key in self.controller.modes_channels_dict.keys() if
-                                     self.controller.modes_channels_dict.get(key) != []])
+        else:
+            data = []
+            for key, labels in self.labels_by_mode.items():
+                values_in_mode = data_measurement[self.indexes_by_mode[key]]
+                data.append(DataFromPlugins(name=_MODE_LABELS[key],
+                                            data=[values_in_mode[i:i + 1] for i in range(values_in_mode.size)],
+                                            dim='Data0D',
+                                            labels=labels))
+            dte = DataToExport(name='keithley', data=data)
         self.dte_signal.emit(dte)
 
     def stop(self):
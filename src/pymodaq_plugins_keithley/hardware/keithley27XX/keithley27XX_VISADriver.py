@@ -1,9 +1,25 @@
+import re
 import numpy as np
 import pyvisa as visa
 from pymodaq_plugins_keithley import config
 from pymodaq.utils.logger import set_logger, get_module_name
 logger = set_logger(get_module_name(__file__))
 
+# Numerical value at the beginning of an element of an ASCII answer (e.g. +1.234567E-03VDC)
+_NUMBER_RE = re.compile(r'\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)')
+
+# SCPI command applying each optional setting of a channel configuration to its mode
+_CHANNEL_SETTINGS = {'range': lambda mode, value: mode + ':RANG:AUTO' if 'autorange' in str(value)
+                     else mode + ':RANG ' + str(value),
+                     'resolution': lambda mode, value: mode + ':DIG ' + str(value),
+                     'nplc': lambda mode, value: mode + ':NPLC ' + str(value)}
+
+# NPLC value of the SCPI keywords accepted by :NPLC (MAX is taken as its 60Hz power line value, the largest)
+_NPLC_KEYWORDS = {'MIN': 0.01, 'MINIMUM': 0.01, 'DEF': 1, 'DEFAULT': 1, 'MAX': 60, 'MAXIMUM': 60}
+
+# pyvisa resource managers shared by all instances, by backend
+_resource_managers = {}
+
 
 class Keithley27XXVISADriver:
     """VISA class driver for the Keithley 27XX Multimeter/Switch System
@@ -14,11 +30,8 @@ class Keithley27XXVISADriver:
     https://download.tek.com/manual/2701-900-01G_Feb_2016.pdf
     """
     # List the Keithley instruments the user has configured from the .toml configuration file
-    list_instruments = {}
-    for instr in config["Keithley", "27XX"].keys():
-        if "INSTRUMENT" in instr:
-            list_instruments[instr] = config["Keithley", "27XX", instr, "rsrc_name"]
-    logger.info("Configured instruments: {}".format(list(list_instruments.items())))
+    list_instruments = {instr: instr_section["rsrc_name"]
+                        for instr, instr_section in config["Keithley", "27XX"].items() if "INSTRUMENT" in instr}
 
     # Non-amps modules
     non_amp_module = {"MODULE01": False, "MODULE02": False}
@@ -34,10 +47,14 @@ class Keithley27XXVISADriver:
                            'FRES': [],
                            'FREQ': [],
                            'TEMP': []}
+    scan_lists_by_mode = {}
     sample_count_1 = False
     reading_scan_list = False
     current_mode = ''
 
+    # VISA timeout (ms) without any channel configured
+    default_timeout = 10000
+
     def __init__(self, rsrc_name):
         """Initialize KeithleyVISADriver class
 
@@ -45,8 +62,10 @@ class Keithley27XXVISADriver:
         :type rsrc_name: string
         """
         self._instr = None
+        self.idn = ""
         self.rsrc_name = rsrc_name
         self.instr = ""
+        self.instr_config = {}
         self.configured_modules = {}
 
     def init_hardware(self, pyvisa_backend='@py'):
@@ -56,54 +75,63 @@ class Keithley27XXVISADriver:
         :type pyvisa_backend: string
         """
         # Open connexion with instrument
-        rm = visa.highlevel.ResourceManager(pyvisa_backend)
-        logger.info("Resources detected by pyvisa: {}".format(rm.list_resources(query='?*')))
+        if pyvisa_backend not in _resource_managers:
+            _resource_managers[pyvisa_backend] = visa.highlevel.ResourceManager(pyvisa_backend)
+        rm = _resource_managers[pyvisa_backend]
+        logger.info("Resources detected by pyvisa: %s", rm.list_resources(query='?*'))
         try:
             self._instr = rm.open_resource(self.rsrc_name,
                                            write_termination="\n",
                                            read_termination="\n",
                                            )
-            self._instr.timeout = 10000
+            self._instr.timeout = self.default_timeout
+            # Large read chunks so that a whole scan list answer is retrieved in a single low-level read
+            self._instr.chunk_size = 64 * 1024
+            # Query identification and switching modules at once (answers separated by ';')
+            self.idn, _, card = self._instr.query("*IDN?;*OPT?").partition(';')
             # Check if the selected resource match the loaded configuration
-            model = self.get_idn()[32:36]
+            # (identification answer: manufacturer,MODEL <model number>,serial number,firmware)
+            idn_fields = self.idn.split(',')
+            model = ''.join(c for c in idn_fields[1] if c.isdigit()) if len(idn_fields) > 1 else self.idn
             if "27" not in model:
-                logger.warning("Driver designed to use Keithley 27XX, not {} model. Problems may occur.".format(model))
-            for instr in config["Keithley", "27XX"]:
-                if type(config["Keithley", "27XX", instr]) == dict:
-                    if self.rsrc_name in config["Keithley", "27XX", instr, "rsrc_name"]:
-                        self.instr = instr
-            logger.info("Instrument selected: {} ".format(config["Keithley", "27XX", self.instr, "rsrc_name"]))
-            logger.info("Keithley model : {}".format(config["Keithley", "27XX", self.instr, "model_name"]))
+                logger.warning("Driver designed to use Keithley 27XX, not %s model. Problems may occur.", model)
+            logger.info("Configured instruments: %s", list(self.list_instruments.items()))
+            for instr, rsrc_name in self.list_instruments.items():
+                if self.rsrc_name in rsrc_name:
+                    self.instr = instr
+            # Only the configuration section of the selected instrument is used from now on
+            self.instr_config = config["Keithley", "27XX", self.instr]
+            logger.info("Instrument selected: %s ", self.instr_config["rsrc_name"])
+            logger.info("Keithley model : %s", self.instr_config["model_name"])
             try:
                 # Load the configuration matching the selected module
-                cards = self.get_card().split(',')
-                logger.info("card : {}".format(cards))
+                cards = card.split(',')
+                logger.info("card : %s", cards)
                 try:
-                    assert config["Keithley", "27XX", self.instr, "MODULE01", "module_name"] == cards[0], cards[0]
+                    assert self.instr_config["MODULE01"]["module_name"] == cards[0], cards[0]
                     self.configured_modules["MODULE01"] = cards[0]
                 except KeyError as err:
-                    logger.error("{}: configuration {} does not exist.".format(KeyError, err))
+                    logger.error("%s: configuration %s does not exist.", KeyError, err)
                 except AssertionError as err:
-                    logger.error("{}: Switching module {} does not match any configuration".format(
-                        AssertionError, str(err)))
+                    logger.error("%s: Switching module %s does not match any configuration",
+                                 AssertionError, err)
                 try:
-                    assert config["Keithley", "27XX", self.instr, "MODULE02", "module_name"] == cards[1], cards[1]
+                    assert self.instr_config["MODULE02"]["module_name"] == cards[1], cards[1]
                     self.configured_modules["MODULE02"] = cards[1]
                 except KeyError as err:
-                    logger.error("{}: configuration {} does not exist." .format(KeyError, err))
+                    logger.error("%s: configuration %s does not exist.", KeyError, err)
                 except AssertionError as err:
-                    logger.error("{}: Switching module {} does not match any configuration".format(
-                        AssertionError, str(err)))
-                logger.info("Configured modules : {}".format(self.configured_modules))
+                    logger.error("%s: Switching module %s does not match any configuration",
+                                 AssertionError, err)
+                logger.info("Configured modules : %s", self.configured_modules)
                 try:
-                    if config["Keithley", "27XX", self.instr, 'MODULE01', 'module_name']\
-                            in self.non_amp_modules_list:
+                    if self.instr_config['MODULE01']['module_name'] in self.non_amp_modules_list:
                         self.non_amp_module["MODULE01"] = True
-                    if config["Keithley", "27XX", self.instr, 'MODULE02', 'module_name']\
-                            in self.non_amp_modules_list:
+                    if self.instr_config['MODULE02']['module_name'] in self.non_amp_modules_list:
                         self.non_amp_module["MODULE02"] = True
                 except KeyError:
                     pass
+                self.set_data_format()
                 logger.info("Hardware initialized")
             except AttributeError:
                 logger.error(AttributeError)
@@ -122,85 +150,88 @@ class Keithley27XXVISADriver:
         logger.info("       ********** CONFIGURATION SEQUENCE INITIALIZED **********")
 
         self.reset()
+        self.set_data_format()
         self.clear_buffer()
-        channels = ''
+        channels = []
+        timeout = self.default_timeout
+        self.modes_channels_dict = {mode: [] for mode in self.modes_channels_dict}
 
         # The following loop set up each channel in the config file
         for module in self.configured_modules:
-            for key in config["Keithley", "27XX", self.instr, module, "CHANNELS"].keys():
+            for key, channel_config in self.instr_config[module]["CHANNELS"].items():
 
                 # Handling user mistakes if the channels' configuration section is not correctly set up
-                if not type(config["Keithley", "27XX", self.instr, module, 'CHANNELS', key]) == dict:
-                    logger.info("Channel {} not correctly defined, must be a dictionary" .format(key))
-                    continue
-                if not config["Keithley", "27XX", self.instr, module, 'CHANNELS', key]:
+                if not type(channel_config) == dict:
+                    logger.info("Channel %s not correctly defined, must be a dictionary", key)
                     continue
-                if "mode" not in config["Keithley", "27XX", self.instr, module, 'CHANNELS', key]:
-                    logger.info("Channel {} not fully defined, 'mode' is missing" .format(key))
+                if not channel_config:
                     continue
-                if config["Keithley", "27XX", self.instr, module, 'CHANNELS', key, "mode"].upper()\
-                        not in self.modes_channels_dict.keys():
-                    logger.info("Channel {} not correctly defined, mode not recognized" .format(key))
+                if "mode" not in channel_config:
+                    logger.info("Channel %s not fully defined, 'mode' is missing", key)
                     continue
-
                 # Channel mode
-                mode = config["Keithley", "27XX", self.instr, module, 'CHANNELS', key, "mode"].upper()
+                mode = channel_config["mode"].upper()
+                if mode not in self.modes_channels_dict:
+                    logger.info("Channel %s not correctly defined, mode not recognized", key)
+                    continue
                 self.modes_channels_dict[mode].append(int(key))
                 channel = '(@' + key + ')'
-                channels += key + ","
-                cmd = "FUNC '" + mode + "'," + channel
-                self._instr.write(cmd)
+                channels.append(key)
+                cmds = ["FUNC '" + mode + "'," + channel]
 
                 # Config
-                if 'range' in config["Keithley", "27XX", self.instr, module, 'CHANNELS', key].keys():
-                    rang = config["Keithley", "27XX", self.instr, module, 'CHANNELS', key, "range"]
-                    if 'autorange' in str(rang):
-                        self._instr.write(mode + ':RANG:AUTO ')
-                    else:
-                        self._instr.write(mode + ':RANG ' + str(range))
+                for setting, setting_cmd in _CHANNEL_SETTINGS.items():
+                    if setting in channel_config:
+                        cmds.append(setting_cmd(mode, channel_config[setting]))
 
-                if 'resolution' in config["Keithley", "27XX", self.instr, module, 'CHANNELS', key].keys():
-                    resolution = config["Keithley", "27XX", self.instr, module, 'CHANNELS', key, "resolution"]
-                    self._instr.write(mode + ':DIG ' + str(resolution))
-
-                if 'nplc' in config["Keithley", "27XX", self.instr, module, 'CHANNELS', key].keys():
-                    nplc = config["Keithley", "27XX", self.instr, module, 'CHANNELS', key, "nplc"]
-                    self._instr.write(mode + ':NPLC ' + str(nplc))
+                # Send the channel configuration as a single compound command
+                self._instr.write(";:".join(cmds))
 
                 if "TEMP" in mode:
-                    transducer = config["Keithley", "27XX", self.instr, module, 'CHANNELS', key, "transducer"].upper()
+                    transducer = channel_config["transducer"].upper()
                     if "TC" in transducer:
-                        tc_type = config["Keithley", "27XX", self.instr, module, 'CHANNELS', key, "type"].upper()
-                        ref_junc = config["Keithley", "27XX", self.instr, module, 'CHANNELS', key, "ref_junc"].upper()
+                        tc_type = channel_config["type"].upper()
+                        ref_junc = channel_config["ref_junc"].upper()
                         self.mode_temp_tc(channel, transducer, tc_type, ref_junc)
                     elif "THER" in transducer:
-                        ther_type = config["Keithley", "27XX", self.instr, module, 'CHANNELS', key, "type"].upper()
+                        ther_type = channel_config["type"].upper()
                         self.mode_temp_ther(channel, transducer, ther_type)
                     elif "FRTD" in transducer:
-                        frtd_type = config["Keithley", "27XX", self.instr, module, 'CHANNELS', key, "type"].upper()
+                        frtd_type = channel_config["type"].upper()
                         self.mode_temp_frtd(channel, transducer, frtd_type)
+                    else:
+                        logger.info("Channel %s not correctly defined, transducer not recognized", key)
 
                 # Console info
-                logger.info("Channels {} \n {}".format(key,
-                                                       config["Keithley", "27XX", self.instr, module, 'CHANNELS', key]))
-                # Timeout update for long measurement modes such as voltage AC
+                logger.info("Channels %s \n %s", key, channel_config)
+                # Timeout update for long measurement modes such as voltage AC and for the integration time
+                # (worst case of a 50Hz power line, with a 50% margin)
                 if "AC" in mode:
-                    self._instr.timeout += 4000
-
-                # Handling errors from Keithley
-                current_error = self.get_error()
-                try:
-                    if current_error != '0,"No error"':
-                        raise ValueError("The following error has been raised by the Keithley:\
-                        %s => Please refer to the User Manual to correct it\n\
+                    timeout += 4000
+                if 'nplc' in channel_config:
+                    try:
+                        nplc = float(channel_config["nplc"])
+                    except (TypeError, ValueError):
+                        nplc = _NPLC_KEYWORDS.get(str(channel_config["nplc"]).upper())
+                    if nplc is not None:
+                        timeout += int(1.5 * 1000 * nplc / 50)
+                    else:
+                        logger.info("Channel %s nplc %s not recognized, integration time not added to the timeout",
+                                    key, channel_config["nplc"])
+
+        # Handling errors raised by the Keithley during the whole sequence
+        current_errors = self.get_all_errors()
+        if current_errors != '0,"No error"':
+            logger.info("The following errors have been raised by the Keithley:\
+                        %s => Please refer to the User Manual to correct them\n\
                         Note: To make sure channels are well configured in the .toml file,\
-                        refer to section 15 'SCPI Reference Tables', Table 15-5" % current_error)
-                except Exception as err:
-                    logger.info("{}".format(err))
-                    pass
-        
+                        refer to section 15 'SCPI Reference Tables', Table 15-5", current_errors)
+
+        self._instr.timeout = timeout
         self.current_mode = 'scan_list'
-        self.channels_scan_list = channels[:-1]
+        self.channels_scan_list = ",".join(channels)
+        self.scan_lists_by_mode = {mode: ",".join(str(chan) for chan in chans)
+                                   for mode, chans in self.modes_channels_dict.items()}
         logger.info("       ********** CONFIGURATION SEQUENCE SUCCESSFULLY ENDED **********")
 
     def clear_buffer(self):
@@ -228,57 +259,35 @@ class Keithley27XXVISADriver:
         - The timestamp of each measurement (numpy array)
         """
         if not self.sample_count_1:
-            # Initiate scan
-            self._instr.write("INIT")
-            # Trigger scan
-            self._instr.write("*TRG")
-            # Get data (equivalent to TRAC:DATA? from buffer)
-            str_answer = self._instr.query("FETCH?")
+            # Initiate scan, trigger it and get data (equivalent to TRAC:DATA? from buffer) in a single transaction
+            str_answer = self._instr.query("INIT;*TRG;:FETCH?")
         else:
             str_answer = self._instr.query("FETCH?")
-        # Split the instrument answer (MEASUREMENT,TIME,READING COUNT) to create a list
-        list_split_answer = str_answer.split(",")
+        # Extract the numerical value of each element of the answer (MEASUREMENT,TIME), units excluded
+        list_values = []
+        for element in str_answer.split(","):
+            match = _NUMBER_RE.match(element)
+            if match is None:
+                raise ValueError("Element {} of the Keithley answer is not a numerical value: {}".format(
+                    element, str_answer))
+            list_values.append(match.group(1))
+        if len(list_values) % 2:
+            raise ValueError("The Keithley answer does not contain (MEASUREMENT,TIME) pairs: {}".format(str_answer))
+        values = np.array(list_values, dtype=float)
 
         # MEASUREMENT & TIME EXTRACTION
-        list_measurements = list_split_answer[::3]
-        str_measurements = ''
-        list_times = list_split_answer[1::3]
-        str_times = ''
-        for j in range(len(list_measurements)):
-            if not j == 0:
-                str_measurements += ','
-                str_times += ','
-            for l1 in range(len(list_measurements[j])):
-                test_carac = list_measurements[j][-(l1+1)]
-                # Remove non-digit characters (units)
-                if test_carac.isdigit():
-                    if l1 == 0:
-                        str_measurements += list_measurements[j]
-                    else:
-                        str_measurements += list_measurements[j][:-l1]
-                    break
-            for l2 in range(len(list_times[j])):
-                test_carac = list_times[j][-(l2+1)]
-                # Remove non-digit characters (units)
-                if test_carac.isdigit():
-                    if l2 == 0:
-                        str_times += list_times[j]
-                    else:
-                        str_times += list_times[j][:-l2]
-                    break
-
-        # Split created string to access each value
-        list_measurements_values = str_measurements.split(",")
-        list_times_values = str_times.split(",")
-        # Create numpy.array containing desired values (float type)
-        array_measurements_values = np.array(list_measurements_values, dtype=float)
+        array_measurements_values = values[::2]
         if not self.sample_count_1:
-            array_times_values = np.array(list_times_values, dtype=float)
+            array_times_values = values[1::2]
         else:
             array_times_values = np.array([0], dtype=float)
 
         return str_answer, array_measurements_values, array_times_values
 
+    def get_all_errors(self):
+        # Ask the keithley to return and clear all the errors of its queue
+        return self._instr.query("SYST:ERR:ALL?")
+
     def get_card(self):
         # Query switching module
         return self._instr.query("*OPT?")
@@ -300,17 +309,17 @@ class Keithley27XXVISADriver:
         self._instr.write("INIT:CONT ON")
 
     def mode_temp_frtd(self, channel, transducer, frtd_type,):
-        self._instr.write("TEMP:TRAN " + transducer + "," + channel)
-        self._instr.write("TEMP:FRTD:TYPE " + frtd_type + "," + channel)
+        self._instr.write("TEMP:TRAN " + transducer + "," + channel +
+                          ";:TEMP:FRTD:TYPE " + frtd_type + "," + channel)
 
     def mode_temp_tc(self, channel, transducer, tc_type, ref_junc,):
-        self._instr.write("TEMP:TRAN " + transducer + "," + channel)
-        self._instr.write("TEMP:TC:TYPE " + tc_type + "," + channel)
-        self._instr.write("TEMP:RJUN:RSEL " + ref_junc + "," + channel)
+        self._instr.write("TEMP:TRAN " + transducer + "," + channel +
+                          ";:TEMP:TC:TYPE " + tc_type + "," + channel +
+                          ";:TEMP:RJUN:RSEL " + ref_junc + "," + channel)
 
     def mode_temp_ther(self, channel, transducer, ther_type,):
-        self._instr.write("TEMP:TRAN " + transducer + "," + channel)
-        self._instr.write("TEMP:THER:TYPE " + ther_type + "," + channel)
+        self._instr.write("TEMP:TRAN " + transducer + "," + channel +
+                          ";:TEMP:THER:TYPE " + ther_type + "," + channel)
     
     def reset(self):
         # Clear measurement event register
@@ -318,6 +327,12 @@ class Keithley27XXVISADriver:
         # One-shot measurement mode (Equivalent to INIT:COUNT OFF)
         self._instr.write("*RST")
 
+    def set_data_format(self):
+        # Only return the reading and its timestamp (the reading number is not used), reset by *RST
+        # ASCII format is kept: binary blocks are sent with an indefinite length header (#0) and ended by a LF,
+        # which cannot be told apart from a LF byte within the binary data
+        self._instr.write("FORM:DATA ASC;:FORM:ELEM READ,TST")
+
     def set_mode(self, mode):
         """Define whether the Keithley will scan all the scan_list or only channels in the selected mode
 
@@ -344,57 +359,33 @@ class Keithley27XXVISADriver:
                 self.reading_scan_list = True
                 self.sample_count_1 = False
                 channels = '(@' + self.channels_scan_list + ')'
-                # Set to perform 1 to INF scan(s)
-                self._instr.write("TRIG:COUN 1")
-                # Trigger immediately after previous scan end if IMM
-                self._instr.write("TRIG:SOUR BUS")
-                # Set to scan <n> channels
                 samp_count = 1 + channels.count(',')
-                self._instr.write("SAMP:COUN "+str(samp_count))
-                # Disable scan if currently enabled
-                self._instr.write("ROUT:SCAN:LSEL NONE")
-                # Set scan list channels
-                self._instr.write("ROUT:SCAN " + channels)
-                # Start scan immediately when enabled and triggered
-                self._instr.write("ROUT:SCAN:TSO IMM")
-                # Enable scan
-                self._instr.write("ROUT:SCAN:LSEL INT")
+                # Perform 1 scan of <n> channels triggered by the bus, start it immediately when enabled and triggered
+                self._instr.write("TRIG:COUN 1;:TRIG:SOUR BUS;:SAMP:COUN " + str(samp_count) +
+                                  ";:ROUT:SCAN:LSEL NONE;:ROUT:SCAN " + channels +
+                                  ";:ROUT:SCAN:TSO IMM;:ROUT:SCAN:LSEL INT")
 
             else:
                 self.reading_scan_list = False
                 # Select channels in the channels list (config file) matching the requested mode
-                channels = '(@' + str(self.modes_channels_dict[mode])[1:-1] + ')'
-                # Set to perform 1 to INF scan(s)
-                self._instr.write("TRIG:COUN 1")
-                # Set to scan <n> channels
+                channels = '(@' + self.scan_lists_by_mode.get(mode, '') + ')'
                 samp_count = 1+channels.count(',')
-                self._instr.write("SAMP:COUN "+str(samp_count))
                 if samp_count == 1:
-                    self.init_cont_on()
-                    # Trigger definition
-                    self._instr.write("TRIG:SOUR IMM")
-                    # Disable scan if currently enabled
-                    self._instr.write("ROUT:SCAN:LSEL NONE")
-                    self._instr.write("ROUT:CLOS " + channels)
-                    
-                    self._instr.write("FUNC '" + mode + "'")
-                    logger.info("rear sample count: {}".format(self.sample_count_1))
-                    if not self.sample_count_1:
-                        self.sample_count_1 = True
+                    # Continuous measurement of the single channel, scan disabled and channel closed
+                    self._instr.write("TRIG:COUN 1;:SAMP:COUN 1;:INIT:CONT ON;:TRIG:SOUR IMM"
+                                      ";:ROUT:SCAN:LSEL NONE;:ROUT:CLOS " + channels +
+                                      ";:FUNC '" + mode + "'")
+                    logger.info("rear sample count: %s", self.sample_count_1)
+                    self.sample_count_1 = True
                     self.reading_scan_list = False
                 else:
                     self.sample_count_1 = False
-                    # Trigger definition
-                    self._instr.write("TRIG:SOUR BUS")
-                    # Disable scan if currently enabled
-                    self._instr.write("ROUT:SCAN:LSEL NONE")
-                    # Set scan list channels
-                    self._instr.write("ROUT:SCAN " + channels)
-                    # Start scan immediately when enabled and triggered
-                    self._instr.write("ROUT:SCAN:TSO IMM")
-                    # Enable scan
-                    self._instr.write("ROUT:SCAN:LSEL INT")
-                
+                    # Perform 1 scan of <n> channels triggered by the bus, start it immediately when enabled and
+                    # triggered
+                    self._instr.write("TRIG:COUN 1;:SAMP:COUN " + str(samp_count) +
+                                      ";:TRIG:SOUR BUS;:ROUT:SCAN:LSEL NONE;:ROUT:SCAN " + channels +
+                                      ";:ROUT:SCAN:TSO IMM;:ROUT:SCAN:LSEL INT")
+
             return channels
         
     def stop_acquisition(self):
@@ -402,15 +393,15 @@ class Keithley27XXVISADriver:
         self._instr.write("ROUT:SCAN:LSEL NONE")
 
     def user_command(self):
-        command = input('Enter here a command you want to send directly to the Keithley [if None, press enter]: ')
-        if command != '':
+        # Send commands typed by the user directly to the Keithley until an empty one is entered
+        while True:
+            command = input('Enter here a command you want to send directly to the Keithley [if None, press enter]: ')
+            if command == '':
+                break
             if command[-1] == "?":
                 print(self._instr.query(command))
             else:
                 self._instr.write(command)
-            self.user_command()
-        else:
-            pass
 
 
 if __name__ == "__main__":